@@ -48,6 +48,7 @@ export const PARAMS = {
     
     // モード管理
     singleGroupMode: false,
+    layerCaching: true,         // トピックタイル・ラベルをオフスクリーンバッファにキャッシュ
     paused: false,
     selectedGroupId: 0
 };
@@ -124,6 +124,12 @@ function setupEventListeners() {
         e.target.textContent = PARAMS.paused ? '▶️ Resume' : '⏸️ Pause';
     });
 
+    // レイヤーキャッシュの切替（描画時間の比較用）
+    document.getElementById('cache-btn').addEventListener('click', (e) => {
+        PARAMS.layerCaching = !PARAMS.layerCaching;
+        e.target.textContent = `Layer Cache: ${PARAMS.layerCaching ? 'ON' : 'OFF'}`;
+    });
+
     // スライダー群のバインド
     setupSlider('threshold', 'leftOutThreshold', (val) => {
         // v0-displayも更新
@@ -181,6 +187,8 @@ function updateUIDynamic() {
     document.getElementById('total-active').textContent = totalActive;
     document.getElementById('total-leftout').textContent = totalLeftOut;
     document.getElementById('halted-count').textContent = haltedCount;
+    document.getElementById('render-ms').textContent = view.frameTimeMs.toFixed(2);
+    document.getElementById('cache-hit').textContent = `${view.getLayerHitRate().toFixed(0)}%`;
     
     // 現在のトピック情報（左パネル）
     const topic = group.getCurrentTopic();
@@ -7,6 +7,7 @@ import { CONFIG, PARAMS } from '../config.js';
 import { arrangeTopicsByProjection } from '../utils.js';
 import Topic from './Topic.js';
 import Member from './Member.js';
+import SpatialGrid from './SpatialGrid.js';
 
 export default class Group {
     /**
@@ -31,6 +32,8 @@ export default class Group {
         this.prevCentroid = this.groupCentroid.copy();
         this.momentum = createVector(0, 0);
         this.lastLeftOutCheck = 0;
+        // Boids近傍探索用の空間インデックス（セルサイズは最大の探索半径）
+        this.grid = new SpatialGrid(Math.max(...Object.values(this._getFlockingRadii())));
 
         // 履歴データ（グラフ描画用）
         this.interestHistory = [];
@@ -84,59 +87,55 @@ export default class Group {
     }
 
     /**
-     * Boidsロジック: 結合（Cohesion）
+     * Boidsの各力の探索半径（モードによって変化）
+     * @returns {{cohesion: number, alignment: number, separation: number}}
      */
-    _cohesion(m) {
-        let steering = createVector(0, 0);
-        let count = 0;
-        let radius = PARAMS.singleGroupMode ? 80 : 50;
-        for (let other of this.members) {
-            let d = p5.Vector.dist(m.pos, other.pos);
-            if (other !== m && !other.leftOut && d < radius) {
-                steering.add(other.pos);
-                count++;
-            }
-        }
-        if (count > 0) {
-            steering.div(count).sub(m.pos).setMag(m.maxSpeed).sub(m.vel).limit(m.maxForce);
-        }
-        return steering;
+    _getFlockingRadii() {
+        return PARAMS.singleGroupMode
+            ? { cohesion: 80, alignment: 65, separation: 25 }
+            : { cohesion: 50, alignment: 40, separation: 15 };
     }
 
     /**
-     * Boidsロジック: 整列（Alignment）
+     * Boidsロジック: 結合（Cohesion）・整列（Alignment）・分離（Separation）
+     * 空間グリッドの周囲セルのみを1回走査し、3つの力をまとめて計算する
+     * @param {Member} m - メンバー
+     * @param {{cohesion: number, alignment: number, separation: number}} radii - 探索半径
+     * @returns {{coh: p5.Vector, ali: p5.Vector, sep: p5.Vector}}
      */
-    _alignment(m) {
-        let steering = createVector(0, 0);
-        let count = 0;
-        let radius = PARAMS.singleGroupMode ? 65 : 40;
-        for (let other of this.members) {
+    _flockingForces(m, radii) {
+        let coh = createVector(0, 0);
+        let ali = createVector(0, 0);
+        let sep = createVector(0, 0);
+        let cohCount = 0;
+        let aliCount = 0;
+
+        this.grid.forEachNearby(m.pos, other => {
+            if (other === m) return;
             let d = p5.Vector.dist(m.pos, other.pos);
-            if (other !== m && !other.leftOut && d < radius) {
-                steering.add(other.vel);
-                count++;
+            if (!other.leftOut) {
+                if (d < radii.cohesion) {
+                    coh.add(other.pos);
+                    cohCount++;
+                }
+                if (d < radii.alignment) {
+                    ali.add(other.vel);
+                    aliCount++;
+                }
             }
-        }
-        if (count > 0) {
-            steering.div(count).setMag(m.maxSpeed).sub(m.vel).limit(m.maxForce);
-        }
-        return steering;
-    }
-
-    /**
-     * Boidsロジック: 分離（Separation）
-     */
-    _separation(m) {
-        let steering = createVector(0, 0);
-        let radius = PARAMS.singleGroupMode ? 25 : 15;
-        for (let other of this.members) {
-            let d = p5.Vector.dist(m.pos, other.pos);
-            if (other !== m && d < radius && d > 0) {
-                let diff = p5.Vector.sub(m.pos, other.pos).div(d);
-                steering.add(diff);
+            if (d < radii.separation && d > 0) {
+                sep.add(p5.Vector.sub(m.pos, other.pos).div(d));
             }
+        });
+
+        if (cohCount > 0) {
+            coh.div(cohCount).sub(m.pos).setMag(m.maxSpeed).sub(m.vel).limit(m.maxForce);
+        }
+        if (aliCount > 0) {
+            ali.div(aliCount).setMag(m.maxSpeed).sub(m.vel).limit(m.maxForce);
         }
-        return steering.limit(m.maxForce);
+        sep.limit(m.maxForce);
+        return { coh, ali, sep };
     }
 
     /**
@@ -169,11 +168,9 @@ export default class Group {
      * Boidsアルゴリズム（相互作用）の適用
      * @private
      */
-    _applyFlocking(member) {
-        // 各種力の計算（Member.jsの実装を呼び出す、あるいはGroup側で計算）
-        const coh = this._cohesion(member);
-        const ali = this._alignment(member);
-        const sep = this._separation(member);
+    _applyFlocking(member, radii) {
+        // 各種力の計算（Boidsの3力は近傍セルのみの1パスで計算）
+        const { coh, ali, sep } = this._flockingForces(member, radii);
         const pull = this._getInterestPull(member);
         const boundary = this._boundaryRepulsion(member);
         
@@ -230,9 +227,12 @@ export default class Group {
         }
 
         // 3. メンバー全員の物理挙動（相互作用）
+        // 空間グリッドは最大の探索半径をセルサイズとしてフレームごとに再構築
+        const radii = this._getFlockingRadii();
+        this.grid.rebuild(this.members, Math.max(radii.cohesion, radii.alignment, radii.separation));
         this.members.forEach(m => {
             if (m.leftOut) return;
-            this._applyFlocking(m);
+            this._applyFlocking(m, radii);
             m.update();
             m.constrainToBounds(this.bounds);
         });
@@ -0,0 +1,58 @@
+/**
+ * SpatialGridクラス
+ * 一様グリッドによる空間ハッシュ。Boidsの近傍探索を周囲3×3セルに限定する
+ */
+
+export default class SpatialGrid {
+    /**
+     * @param {number} cellSize - セルの一辺の長さ（最大の探索半径以上にすること）
+     */
+    constructor(cellSize) {
+        this.cellSize = cellSize;
+        this.cells = new Map(); // "col,row" -> Member[]
+    }
+
+    /**
+     * セルのキーを取得
+     * @private
+     */
+    _key(col, row) {
+        return `${col},${row}`;
+    }
+
+    /**
+     * 全メンバーをセルに振り分け直す（1フレームに1回呼ぶ）
+     * @param {Member[]} members
+     * @param {number} [cellSize] - 指定された場合はセルサイズを更新する
+     */
+    rebuild(members, cellSize = this.cellSize) {
+        this.cellSize = cellSize;
+        this.cells.clear();
+        for (const m of members) {
+            const key = this._key(
+                Math.floor(m.pos.x / this.cellSize),
+                Math.floor(m.pos.y / this.cellSize)
+            );
+            const cell = this.cells.get(key);
+            if (cell) cell.push(m);
+            else this.cells.set(key, [m]);
+        }
+    }
+
+    /**
+     * 指定座標の周囲3×3セルに含まれるメンバーを順に処理する
+     * @param {p5.Vector} pos - 探索の中心座標
+     * @param {function(Member): void} callback
+     */
+    forEachNearby(pos, callback) {
+        const col = Math.floor(pos.x / this.cellSize);
+        const row = Math.floor(pos.y / this.cellSize);
+        for (let dy = -1; dy <= 1; dy++) {
+            for (let dx = -1; dx <= 1; dx++) {
+                const cell = this.cells.get(this._key(col + dx, row + dy));
+                if (!cell) continue;
+                for (const m of cell) callback(m);
+            }
+        }
+    }
+}
@@ -12,6 +12,12 @@ export default class GraphView {
         this.graphCanvas = document.getElementById('graph-canvas');
         this.ctx = this.graphCanvas.getContext('2d');
         this._setupHighDPI();
+
+        // レイヤーキャッシュ（"groupId:レイヤー名" -> {group, key, graphics}）
+        this.layers = new Map();
+        this.layerDraws = 0;   // キャッシュ済みレイヤーの描画回数（累計）
+        this.layerRedraws = 0; // うちバッファを再描画した回数（累計）
+        this.frameTimeMs = 0;  // シミュレーション画面の描画時間（ms, 移動平均）
     }
 
     /**
@@ -34,41 +40,150 @@ export default class GraphView {
      * @param {Group[]} groups 
      */
     renderSimulation(groups) {
+        const start = performance.now();
         background(15, 15, 22);
         groups.forEach(group => this._drawGroup(group));
+        this._pruneLayers(groups);
+
+        // 描画時間（ms）の指数移動平均
+        const elapsed = performance.now() - start;
+        this.frameTimeMs = this.frameTimeMs * 0.9 + elapsed * 0.1;
     }
 
     /**
      * グループ全体の描画（枠、トピック、メンバー）
+     * トピックタイル・ラベルはオフスクリーンバッファにキャッシュし、メンバーのみ毎フレーム描画する
      * @private
      */
     _drawGroup(group) {
-        const { bounds, topics, members, halted, id } = group;
+        const { members } = group;
         const scaleFactor = PARAMS.singleGroupMode ? 1.8 : 1.0;
+
+        // 1〜2. トピックグリッドとグループ境界線（静的レイヤー）
+        if (PARAMS.layerCaching) {
+            this._drawCachedLayer(group, 'topics', this._getTopicLayerKey(group),
+                g => this._drawTopicLayer(g, group, scaleFactor));
+        } else {
+            // グローバルモードではp5の描画関数がwindowに定義されているため、直接メインキャンバスへ描画する
+            this._drawTopicLayer(window, group, scaleFactor);
+        }
+
+        // 3. メンバーの描画（動的レイヤー）
+        members.filter(m => !m.leftOut).forEach(m => this._drawMember(m, scaleFactor));
+        members.filter(m => m.leftOut).forEach(m => this._drawMember(m, scaleFactor));
+
+        // 4. ラベル表示（静的レイヤー）
+        if (PARAMS.layerCaching) {
+            this._drawCachedLayer(group, 'labels', this._getLabelLayerKey(group),
+                g => this._drawGroupLabels(g, group, scaleFactor));
+        } else {
+            this._drawGroupLabels(window, group, scaleFactor);
+        }
+    }
+
+    /**
+     * トピックグリッドとグループ境界線を描画
+     * @param {Object} g - 描画先（p5.Graphics またはメインキャンバス）
+     * @private
+     */
+    _drawTopicLayer(g, group, scaleFactor) {
+        const { bounds, topics, halted } = group;
         const tileW = bounds.w / 5; // gridCols
         const tileH = bounds.h / 4; // gridRows
 
-        // 1. トピックグリッドの描画
         topics.forEach(topic => {
             const isCurrent = topic.id === group.currentTopicIndex;
-            this._drawTopic(topic, isCurrent, bounds, tileW, tileH, scaleFactor);
+            this._drawTopic(g, topic, isCurrent, bounds, tileW, tileH, scaleFactor);
         });
 
-        // 2. グループ境界線
-        noFill();
-        stroke(halted ? color(255, 80, 80) : color(80, 90, 110));
-        strokeWeight(halted ? 3 : 2);
-        rect(bounds.x, bounds.y, bounds.w, bounds.h, 3);
+        g.noFill();
+        g.stroke(halted ? color(255, 80, 80) : color(80, 90, 110));
+        g.strokeWeight(halted ? 3 : 2);
+        g.rect(bounds.x, bounds.y, bounds.w, bounds.h, 3);
+    }
 
-        // 3. メンバーの描画
-        members.filter(m => !m.leftOut).forEach(m => this._drawMember(m, scaleFactor));
-        members.filter(m => m.leftOut).forEach(m => this._drawMember(m, scaleFactor));
+    /**
+     * トピックレイヤーのキャッシュキー
+     * タイルの見た目は「現在の話題」「熱の段階（heat > 0.3）」「停止状態」でのみ変化する
+     * @private
+     */
+    _getTopicLayerKey(group) {
+        const hot = group.topics.map(t => (t.heat > 0.3 ? 1 : 0)).join('');
+        return `${group.currentTopicIndex}|${group.halted}|${hot}`;
+    }
 
-        // 4. ラベル表示
-        this._drawGroupLabels(group, scaleFactor);
+    /**
+     * ラベルレイヤーのキャッシュキー
+     * @private
+     */
+    _getLabelLayerKey(group) {
+        return `${group.getLeftOutCount()}|${group.halted}`;
     }
 
-/**
+    /**
+     * キャッシュ済みのオフスクリーンバッファを描画する
+     * キーが変化した場合のみバッファを再描画する
+     * @param {Group} group
+     * @param {string} name - レイヤー名
+     * @param {string} key - レイヤーの見た目を決める状態
+     * @param {function(p5.Graphics): void} drawFn - バッファへの描画処理（ワールド座標）
+     * @private
+     */
+    _drawCachedLayer(group, name, key, drawFn) {
+        const pad = 2; // 境界線の太さ分の余白
+        const { bounds } = group;
+        const cacheId = `${group.id}:${name}`;
+        let layer = this.layers.get(cacheId);
+
+        // グループが作り直された（リスタート・モード切替）場合はバッファも作り直す
+        if (!layer || layer.group !== group) {
+            if (layer) layer.graphics.remove();
+            layer = {
+                group,
+                key: null,
+                graphics: createGraphics(Math.ceil(bounds.w) + pad * 2, Math.ceil(bounds.h) + pad * 2)
+            };
+            this.layers.set(cacheId, layer);
+        }
+
+        if (layer.key !== key) {
+            const g = layer.graphics;
+            g.clear();
+            g.push();
+            g.translate(pad - bounds.x, pad - bounds.y);
+            drawFn(g);
+            g.pop();
+            layer.key = key;
+            this.layerRedraws++;
+        }
+
+        image(layer.graphics, bounds.x - pad, bounds.y - pad);
+        this.layerDraws++;
+    }
+
+    /**
+     * レイヤーキャッシュのヒット率（%）
+     * @returns {number}
+     */
+    getLayerHitRate() {
+        if (this.layerDraws === 0) return 0;
+        return (1 - this.layerRedraws / this.layerDraws) * 100;
+    }
+
+    /**
+     * 現在表示していないグループのバッファを破棄する
+     * @private
+     */
+    _pruneLayers(groups) {
+        for (const [cacheId, layer] of this.layers) {
+            if (!groups.includes(layer.group)) {
+                layer.graphics.remove();
+                this.layers.delete(cacheId);
+            }
+        }
+    }
+
+    /**
      * 個々のメンバー（三角形）を描画
      * @private
      */
@@ -125,7 +240,7 @@ export default class GraphView {
      * 個々のトピックタイルの描画
      * @private
      */
-    _drawTopic(topic, isCurrent, bounds, tileW, tileH, scaleFactor) {
+    _drawTopic(g, topic, isCurrent, bounds, tileW, tileH, scaleFactor) {
         const x = bounds.x + topic.gridX * tileW;
         const y = bounds.y + topic.gridY * tileH;
 
@@ -133,52 +248,52 @@ export default class GraphView {
         const primaryColor = color(CONFIG.dimensionColors[topic.primaryDim]);
 
         if (isCurrent) {
-            fill(red(primaryColor) * 0.35, green(primaryColor) * 0.35, blue(primaryColor) * 0.35);
-            stroke(primaryColor);
-            strokeWeight(2 * scaleFactor);
+            g.fill(red(primaryColor) * 0.35, green(primaryColor) * 0.35, blue(primaryColor) * 0.35);
+            g.stroke(primaryColor);
+            g.strokeWeight(2 * scaleFactor);
         } else {
             const shade = topic.heat > 0.3 ? 0.18 : 0.12;
-            fill(red(primaryColor) * shade, green(primaryColor) * shade, blue(primaryColor) * shade);
-            stroke(red(primaryColor) * 0.3, green(primaryColor) * 0.3, blue(primaryColor) * 0.3);
-            strokeWeight(1);
+            g.fill(red(primaryColor) * shade, green(primaryColor) * shade, blue(primaryColor) * shade);
+            g.stroke(red(primaryColor) * 0.3, green(primaryColor) * 0.3, blue(primaryColor) * 0.3);
+            g.strokeWeight(1);
         }
 
-        rect(x, y, tileW, tileH);
+        g.rect(x, y, tileW, tileH);
 
         // トピック名の描画
-        fill(isCurrent ? 255 : 100);
-        noStroke();
-        textSize(5 * scaleFactor);
-        textAlign(CENTER, CENTER);
-        text(topic.getShortName().substr(0, PARAMS.singleGroupMode ? 8 : 5), x + tileW / 2, y + tileH / 2);
+        g.fill(isCurrent ? 255 : 100);
+        g.noStroke();
+        g.textSize(5 * scaleFactor);
+        g.textAlign(CENTER, CENTER);
+        g.text(topic.getShortName().substr(0, PARAMS.singleGroupMode ? 8 : 5), x + tileW / 2, y + tileH / 2);
     }
 
     /**
      * グループのラベル（G1、❄️数、停止表示など）の描画
      * @private
      */
-    _drawGroupLabels(group, scaleFactor) {
+    _drawGroupLabels(g, group, scaleFactor) {
         const { bounds, halted, id } = group;
         
-        fill(255);
-        noStroke();
-        textSize(7 * scaleFactor);
-        textAlign(LEFT, TOP);
-        text(CONFIG.groupNames[id], bounds.x + 3, bounds.y + 2);
+        g.fill(255);
+        g.noStroke();
+        g.textSize(7 * scaleFactor);
+        g.textAlign(LEFT, TOP);
+        g.text(CONFIG.groupNames[id], bounds.x + 3, bounds.y + 2);
 
         const frozen = group.getLeftOutCount();
         if (frozen > 0) {
-            fill(255, 100, 100);
-            text(`❄️${frozen}`, bounds.x + 16 * scaleFactor, bounds.y + 2);
+            g.fill(255, 100, 100);
+            g.text(`❄️${frozen}`, bounds.x + 16 * scaleFactor, bounds.y + 2);
         }
 
         if (halted) {
-            fill(60, 20, 20, 200);
-            rect(bounds.x, bounds.y, bounds.w, bounds.h);
-            fill(255, 100, 100);
-            textSize(9 * scaleFactor);
-            textAlign(CENTER, CENTER);
-            text('⛔ HALTED', bounds.x + bounds.w / 2, bounds.y + bounds.h / 2 - 6 * scaleFactor);
+            g.fill(60, 20, 20, 200);
+            g.rect(bounds.x, bounds.y, bounds.w, bounds.h);
+            g.fill(255, 100, 100);
+            g.textSize(9 * scaleFactor);
+            g.textAlign(CENTER, CENTER);
+            g.text('⛔ HALTED', bounds.x + bounds.w / 2, bounds.y + bounds.h / 2 - 6 * scaleFactor);
         }
     }
 
@@ -2,6 +2,7 @@ import os
 import re
 import numpy as np
 import json
+from collections import Counter
 from sklearn.datasets import fetch_20newsgroups
 import matplotlib.pyplot as plt
 import umap
@@ -31,6 +32,7 @@ class TopicVectorPipeline:
         self.X_2d = None
         self.X_20d = None
         self.topic_data = []
+        self.pyramid = []  # 粗い階層から順に並んだトピックノードのリスト
 
 # --- 1. エントリポイント (ロジック制御) ---
     def prepare_model(self):
@@ -228,6 +230,83 @@ class TopicVectorPipeline:
                 "vector": centroid_vec_l2.tolist()
             })
 
+    # --- 5. 責任：多解像度トピックピラミッド (Hierarchy) ---
+    def run_pyramid_extraction(self, levels=(10, 20, 50)):
+        """
+        Top2Vecの階層的トピック削減で、粗い階層から細かい階層へのトピックピラミッドを作成する。
+        levels は削減後のトピック数（昇順）。最下層には削減なしの全トピックが追加される。
+        """
+        if self.X_2d is None:
+            self._reduce_dimensions()
+
+        num_all = self.model.get_num_topics()
+        self.pyramid = []
+        for num_topics in sorted({n for n in levels if n < num_all}):
+            print(f"Reducing to {num_topics} topics...")
+            hierarchy = self.model.hierarchical_topic_reduction(num_topics)
+            topic_words, _, _ = self.model.get_topics(num_topics, reduced=True)
+            sizes = self._topic_size_lookup(reduced=True)
+            self.pyramid.append([
+                self._extract_pyramid_node(t_num, topic_words[t_num], originals, sizes[t_num], reduced=True)
+                for t_num, originals in enumerate(hierarchy)
+            ])
+
+        print(f"Extracting all {num_all} topics for the finest level...")
+        all_topic_words, _, _ = self.model.get_topics()
+        sizes = self._topic_size_lookup(reduced=False)
+        self.pyramid.append([
+            self._extract_pyramid_node(t_num, all_topic_words[t_num], [t_num], sizes[t_num], reduced=False)
+            for t_num in range(num_all)
+        ])
+        self._link_pyramid_levels()
+
+    def _topic_size_lookup(self, reduced):
+        """トピック番号 -> ドキュメント数"""
+        topic_sizes, topic_nums = self.model.get_topic_sizes(reduced=reduced)
+        return {int(t): int(size) for t, size in zip(topic_nums, topic_sizes)}
+
+    def _extract_pyramid_node(self, t_num, words, originals, size, reduced):
+        # 細かい階層には50件未満のトピックもあるため、トピックの大きさを上限とする
+        doc_indices = self.model.search_documents_by_topic(
+            topic_num=t_num, num_docs=min(50, size), reduced=reduced
+        )[2]
+
+        # 代表点と代表ベクトル（_extract_topic_metadata と同じ算出方法）
+        pos = np.median(self.X_2d[doc_indices], axis=0)
+        vec = np.mean(self.X_20d[doc_indices], axis=0)
+        vec_l2 = vec / np.linalg.norm(vec)
+
+        return {
+            "id": int(t_num),
+            "name": "_".join(words[:3]),
+            "x": float(pos[0]), "y": float(pos[1]),
+            "vector": vec_l2.tolist(),
+            "topics": [int(o) for o in originals],  # 含まれる元のトピック番号
+            "parent": None,
+            "children": []
+        }
+
+    def _link_pyramid_levels(self):
+        """隣接する階層間で、元のトピックを最も多く共有するノードを親として親子リンクを張る"""
+        for coarse, fine in zip(self.pyramid[:-1], self.pyramid[1:]):
+            owner = {o: idx for idx, node in enumerate(coarse) for o in node["topics"]}
+            for idx, node in enumerate(fine):
+                parent = Counter(owner[o] for o in node["topics"] if o in owner).most_common(1)[0][0]
+                node["parent"] = parent
+                coarse[parent]["children"].append(idx)
+
+    def save_pyramid(self, json_path):
+        """全階層を1つのJSONに保存する"""
+        print(f"Saving topic pyramid to {json_path}...")
+        data = {
+            "levels": [
+                {"num_topics": len(level), "topics": level}
+                for level in self.pyramid
+            ]
+        }
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
     def save_results(self, json_path, img_path):
         """ファイル出力とプロットの生成。描画ロジックをカプセル化。"""
         print(f"4. Saving Results to {json_path} and {img_path}...")
@@ -259,4 +338,8 @@ if __name__ == "__main__":
     pipeline = TopicVectorPipeline()
     pipeline.prepare_model()
     pipeline.extract_top_topics()
-    pipeline.save_results("umap_opt.json", "umap_opt_map.png")
\ No newline at end of file
+    pipeline.save_results("umap_opt.json", "umap_opt_map.png")
+
+    # 多解像度トピックピラミッドの出力
+    pipeline.run_pyramid_extraction(levels=(10, 20, 50))
+    pipeline.save_pyramid("topic_pyramid.json")
\ No newline at end of file
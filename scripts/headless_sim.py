@@ -0,0 +1,362 @@
+import json
+import numpy as np
+
+from spatial_grid import SpatialGrid, flocking_radii, flocking_forces
+from member_events import MemberStateScheduler, STATE_ACTIVE, STATE_AT_RISK
+from population import sample_profiles
+
+# js/config.js の CONFIG / PARAMS に対応する既定値
+CONFIG = {
+    'maxVelocity': 10.0,
+    'maxInterest': 10.0,
+    'minActiveMembers': 3,
+}
+
+PARAMS = {
+    'cohesionWeight': 2.0,
+    'alignmentWeight': 0.8,
+    'separationWeight': 1.0,
+    'interestPullWeight': 0.5,
+    'recoveryThreshold': 0.07,
+    'leftOutThreshold': 0.12,
+    'leftOutCheckFrequency': 45,
+    'heatDecayRate': 0.008,
+    'momentumWeight': 0.3,
+}
+
+GRID_COLS = 5
+GRID_ROWS = 4
+
+# 4グループモードの1グループ分の描画領域（640x320 キャンバスを2x2分割した大きさ）
+GROUP_W = 314.0
+GROUP_H = 154.0
+
+
+def load_topic_vectors(json_path='../data/topics/topics.json'):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        topics = json.load(f)
+    return np.array([t['vector'] for t in topics], dtype=float)
+
+
+def arrange_topics_by_projection(vectors, cols=GRID_COLS, rows=GRID_ROWS):
+    """
+    js/utils.js の arrangeTopicsByProjection と同じ方法で話題をグリッドに配置する。
+
+    Returns:
+        (rows, cols) の配列。各セルに入る話題のインデックス（空きセルは -1）
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    k = vectors.shape[1]
+    angles = np.arange(k) / k * np.pi * 2
+    pos = np.stack([vectors @ np.cos(angles), vectors @ np.sin(angles)], axis=1)
+
+    span = pos.max(axis=0) - pos.min(axis=0)
+    norm = (pos - pos.min(axis=0)) / np.where(span > 0, span, 1.0)
+
+    layout = np.full((rows, cols), -1, dtype=np.int64)
+    for i in np.lexsort((norm[:, 0], norm[:, 1])):
+        target_col = min(cols - 1, max(0, int(np.floor(norm[i, 0] * cols * 0.999))))
+        target_row = min(rows - 1, max(0, int(np.floor(norm[i, 1] * rows * 0.999))))
+
+        # スパイラル探索で最も近い空きセルに配置
+        placed = False
+        for radius in range(max(cols, rows) + 1):
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    if placed or (abs(dx) != radius and abs(dy) != radius):
+                        continue
+                    c, r = target_col + dx, target_row + dy
+                    if 0 <= c < cols and 0 <= r < rows and layout[r, c] < 0:
+                        layout[r, c] = i
+                        placed = True
+            if placed:
+                break
+    return layout
+
+
+class HeadlessSimulation:
+    """
+    js/models/Group.js の挙動を描画なしで全グループ一括に計算するシミュレータ。
+
+    全グループのメンバーを1つの座標空間に並べ（グループ間は探索半径より広く離す）、
+    Boidsの力は SpatialGrid で、メンバー状態の判定は MemberStateScheduler で計算する。
+    LEFT_OUT への遷移は js 側では未実装のため、次の規則で離脱を判定する:
+      AT_RISK（vG - v_i > recoveryThreshold）のメンバーのうち、
+        (1) 興味に基づく相対速度 vG - v_i が leftOutThreshold (v1) を超え、かつ
+        (2) 前回の判定からの「グループ重心の移動量 - 重心の移動方向へのメンバーの移動量」を
+            1フレームあたりに直し maxVelocity / maxSpeed 倍した観測上の遅れも v1 を超える
+      状態が2回の判定で連続した場合に離脱とする。(2) は v1 と同じ速度の尺度で、
+      結合の強さ（cohesionWeight）によってグループに追従できるかどうかを表す。
+    アクティブ人数が minActiveMembers 未満になったグループは停止とする。
+    状態の判定は Group.update と同じく leftOutCheckFrequency フレーム経過後に始まり、
+    以降の AT_RISK 判定はイベント駆動、離脱判定は leftOutCheckFrequency ごとに行う。
+    """
+
+    def __init__(self, params=None, num_groups=4, group_size=3, topic_vectors=None,
+                 distribution='primary', seed=0, population=None):
+        """
+        Args:
+            population: 潜在興味ベクトル (グループ数, グループ人数, 次元)。
+                population.SharedPopulation の一部を渡すと、メンバーを生成せずにそれを使う
+                （num_groups, group_size は形状から決まる）
+        """
+        self.params = dict(PARAMS, **(params or {}))
+        self.rng = np.random.default_rng(seed)
+        self.topic_vectors = load_topic_vectors() if topic_vectors is None else np.asarray(topic_vectors, dtype=float)
+        if population is not None:
+            num_groups, group_size = population.shape[:2]
+        self.num_groups = num_groups
+        self.group_size = group_size
+        num_topics = len(self.topic_vectors)
+
+        # グループの配置（横一列、探索半径より広い間隔）
+        self.radii = flocking_radii(single_group_mode=False)
+        gap = max(self.radii.values()) * 2
+        self.origins = np.stack([np.arange(num_groups) * (GROUP_W + gap), np.zeros(num_groups)], axis=1)
+
+        # 話題のグリッド配置とタイル中心座標 (G, T, 2)
+        self.layout = arrange_topics_by_projection(self.topic_vectors)
+        tile = np.array([GROUP_W / GRID_COLS, GROUP_H / GRID_ROWS])
+        cell = np.zeros((num_topics, 2))
+        for r, c in zip(*np.nonzero(self.layout >= 0)):
+            cell[self.layout[r, c]] = (c, r)
+        self.tile = tile
+        self.topic_centers = self.origins[:, None, :] + (cell + 0.5) * tile
+
+        # メンバー
+        n = num_groups * group_size
+        self.group_of = np.repeat(np.arange(num_groups), group_size)
+        if population is None:
+            latent = sample_profiles(self.rng, n, self.topic_vectors.shape[1], distribution)
+        else:
+            latent = np.asarray(population, dtype=float).reshape(n, -1)
+        self.match = latent @ self.topic_vectors.T   # (N, T) 興味マッチ度
+        center = self.origins + np.array([GROUP_W, GROUP_H]) / 2
+        self.pos = center[self.group_of] + (self.rng.random((n, 2)) - 0.5) * 50
+        angle = self.rng.uniform(0, np.pi * 2, size=n)
+        self.vel = np.stack([np.cos(angle), np.sin(angle)], axis=1) * 0.2
+        self.max_speed = 0.9
+        self.max_force = 0.05
+        self.current_velocity = np.zeros(n)   # 現在の話題に基づく速度（Member.currentVelocity）
+        self.left_out = np.zeros(n, dtype=bool)
+
+        # グループ・話題の状態
+        self.heat = np.zeros((num_groups, num_topics))
+        self.visits = np.zeros((num_groups, num_topics), dtype=np.int64)
+        self.current_topic = np.zeros(num_groups, dtype=np.int64)
+        self.centroid = center.copy()
+        self.momentum = np.zeros((num_groups, 2))
+        self.halted = np.zeros(num_groups, dtype=bool)
+        self.halt_frame = np.full(num_groups, -1, dtype=np.int64)
+
+        self.frame = 0
+        self.grid = SpatialGrid(max(self.radii.values()))
+        self.scheduler = MemberStateScheduler(
+            latent.reshape(num_groups, group_size, -1), self.topic_vectors,
+            recovery_threshold=self.params['recoveryThreshold'],
+            max_interest=CONFIG['maxInterest'], max_velocity=CONFIG['maxVelocity']
+        )
+
+        self.checks_started = False
+        self.check_pos = None        # 前回の離脱判定時のメンバー位置
+        self.check_centroid = None   # 前回の離脱判定時のグループ重心
+        self.lag_streak = np.zeros(n, dtype=np.int64)   # 離脱条件を連続で満たした判定回数
+
+        # 初期状態の計算（Group コンストラクタの _updateMemberInterests に対応）
+        # 興味と速度のみを計算し、状態の判定は leftOutCheckFrequency フレーム後まで行わない
+        self._update_member_interests(np.arange(num_groups))
+
+    def _update_member_interests(self, groups):
+        """Group._updateMemberInterests: 現在の話題に対する速度を更新"""
+        for g in groups:
+            members = self.group_of == g
+            self.current_velocity[members] = self.match[members, self.current_topic[g]] * CONFIG['maxVelocity']
+
+    # --- 1フレームの更新 ---
+    def step(self):
+        p = self.params
+        running = ~self.halted
+        self.heat[running] = np.maximum(0.0, self.heat[running] - p['heatDecayRate'])
+
+        movable = ~self.left_out & running[self.group_of]
+        self.grid.rebuild(self.pos)
+        coh, ali, sep = flocking_forces(self.grid, self.vel, self.left_out,
+                                        self.max_speed, self.max_force, self.radii)
+        pull = self._interest_pull()
+        boundary = self._boundary_repulsion()
+
+        interest_norm = (self.current_velocity / CONFIG['maxVelocity'])[:, None]
+        acc = (coh * p['cohesionWeight'] * (0.4 + interest_norm * 0.6)
+               + ali * p['alignmentWeight'] * (0.4 + interest_norm * 0.6)
+               + sep * p['separationWeight']
+               + pull * p['interestPullWeight'] * self.max_force * (0.3 + interest_norm * 0.7)
+               + boundary
+               + self.momentum[self.group_of] * p['momentumWeight'] * self.max_force)
+
+        # Member.update: 興味レベルに応じたスピード制限（p5.map(v, 0, maxVelocity, 0.4, 1.0)）
+        speed_mult = 0.4 + self.current_velocity / CONFIG['maxVelocity'] * 0.6
+        vel = self.vel + acc
+        norm = np.linalg.norm(vel, axis=1)
+        cap = self.max_speed * speed_mult
+        vel *= np.where(norm > cap, cap / np.where(norm > 0, norm, 1.0), 1.0)[:, None]
+        self.vel[movable] = vel[movable]
+        self.pos[movable] += vel[movable]
+
+        # Member.constrainToBounds
+        lo = self.origins[self.group_of] + 5
+        hi = self.origins[self.group_of] + np.array([GROUP_W, GROUP_H]) - 5
+        self.pos = np.clip(self.pos, lo, hi)
+
+        self._update_centroids()
+        self._update_current_topics()
+        self.frame += 1
+
+        # 最初の状態判定は Group.update と同じく leftOutCheckFrequency フレーム後
+        frequency = p['leftOutCheckFrequency']
+        if not self.checks_started and self.frame >= frequency:
+            self.checks_started = True
+            for g in np.nonzero(~self.halted)[0]:
+                self.scheduler.enter_topic(int(g), int(self.current_topic[g]), frame=self.frame)
+        if self.checks_started:
+            self.scheduler.advance(self.frame)
+            if self.frame % frequency == 0:
+                self._check_left_out()
+
+    def _interest_pull(self):
+        """Member.getPreferredDirection を全員分まとめて計算"""
+        g = self.group_of
+        weight = self.match ** 2 * (1 - self.heat[g] * 0.7) + 0.1 * (self.visits[g] == 0)
+        weight = np.maximum(0.01, weight)
+        target = np.einsum('nt,ntc->nc', weight, self.topic_centers[g]) / weight.sum(axis=1, keepdims=True)
+        pull = target - self.pos
+        norm = np.linalg.norm(pull, axis=1, keepdims=True)
+        return np.where(norm > 0, pull / np.where(norm > 0, norm, 1.0), 0.0)
+
+    def _boundary_repulsion(self):
+        margin, force = 8.0, 0.08
+        local = self.pos - self.origins[self.group_of]
+        repulsion = np.zeros_like(local)
+        repulsion[local < margin] += force
+        repulsion[local > np.array([GROUP_W, GROUP_H]) - margin] -= force
+        return repulsion
+
+    def _update_centroids(self):
+        """Group._calculateCentroid（ACTIVE 状態のメンバーのみ）"""
+        states = np.concatenate([self.scheduler.groups[g].states for g in range(self.num_groups)])
+        active = (states == STATE_ACTIVE) & ~self.halted[self.group_of]
+        counts = np.bincount(self.group_of[active], minlength=self.num_groups)
+        sums = np.zeros((self.num_groups, 2))
+        np.add.at(sums, self.group_of[active], self.pos[active])
+
+        has = counts > 0
+        new_centroid = self.centroid.copy()
+        new_centroid[has] = sums[has] / counts[has, None]
+        delta = new_centroid - self.centroid
+        self.centroid = new_centroid
+
+        momentum = self.momentum + (delta - self.momentum) * 0.15
+        norm = np.linalg.norm(momentum, axis=1, keepdims=True)
+        momentum = np.where(norm > 0.01, momentum / np.where(norm > 0, norm, 1.0), momentum)
+        self.momentum[has] = momentum[has]
+
+    def _update_current_topics(self):
+        """Group._updateCurrentTopic: 重心のタイルが変わったグループを入室イベントとして登録"""
+        cell = np.floor((self.centroid - self.origins) / self.tile).astype(np.int64)
+        inside = (cell[:, 0] >= 0) & (cell[:, 0] < GRID_COLS) & (cell[:, 1] >= 0) & (cell[:, 1] < GRID_ROWS)
+        topic = np.full(self.num_groups, -1, dtype=np.int64)
+        topic[inside] = self.layout[cell[inside, 1], cell[inside, 0]]
+
+        entered = np.nonzero((topic >= 0) & (topic != self.current_topic) & ~self.halted)[0]
+        for g in entered:
+            self.current_topic[g] = topic[g]
+            self.heat[g, topic[g]] = 1.0
+            self.visits[g, topic[g]] += 1
+            if self.checks_started:
+                self.scheduler.enter_topic(int(g), int(topic[g]), frame=self.frame)
+        self._update_member_interests(entered)
+        return entered
+
+    def _check_left_out(self):
+        """
+        AT_RISK のメンバーについて離脱・停止を判定する。
+        離脱による vG の変化はスケジューラのイベントとして反映され、次回の判定で考慮される。
+        """
+        n = len(self.group_of)
+        at_risk = np.zeros(n, dtype=bool)
+        relative = np.zeros(n)
+        for g in np.nonzero(~self.halted)[0]:
+            members = slice(g * self.group_size, (g + 1) * self.group_size)
+            group = self.scheduler.groups[g]
+            at_risk[members] = group.states == STATE_AT_RISK
+            relative[members] = group.group_velocity - group.velocities
+
+        # 前回の判定からの観測上の遅れ（重心の移動方向への追従不足）を速度の尺度に換算
+        lag = np.zeros(n)
+        if self.check_pos is not None:
+            moved = self.pos - self.check_pos
+            shift = (self.centroid - self.check_centroid)[self.group_of]
+            shift_norm = np.linalg.norm(shift, axis=1)
+            direction = shift / np.where(shift_norm > 0, shift_norm, 1.0)[:, None]
+            behind = shift_norm - np.sum(moved * direction, axis=1)
+            lag = behind / self.params['leftOutCheckFrequency'] * CONFIG['maxVelocity'] / self.max_speed
+        self.check_pos = self.pos.copy()
+        self.check_centroid = self.centroid.copy()
+
+        threshold = self.params['leftOutThreshold']
+        over = at_risk & (relative > threshold) & (lag > threshold)
+        self.lag_streak = np.where(over, self.lag_streak + 1, 0)
+        frozen = self.lag_streak >= 2
+        if not frozen.any():
+            return
+
+        for i in np.nonzero(frozen)[0]:
+            g, m = int(self.group_of[i]), int(i % self.group_size)
+            self.left_out[i] = True
+            self.scheduler.set_left_out(g, m, True, frame=self.frame)
+        self.lag_streak[frozen] = 0
+        self.scheduler.advance(self.frame)
+
+        for g in np.unique(self.group_of[frozen]):
+            active = np.sum(~self.left_out[self.group_of == g])
+            if active < min(CONFIG['minActiveMembers'], self.group_size):
+                self.halted[g] = True
+                self.halt_frame[g] = self.frame
+
+    # --- 実行と集計 ---
+    def run(self, frames=3600):
+        for _ in range(frames):
+            if self.halted.all():
+                break
+            self.step()
+        return self.summary(frames)
+
+    def summary(self, frames):
+        """
+        Returns:
+            frozen_rate: 離脱したメンバーの割合
+            time_to_halt: グループが停止するまでのフレーム数の平均（停止しなかったグループは frames）
+            halted_rate: 停止したグループの割合
+        """
+        halt_time = np.where(self.halt_frame >= 0, self.halt_frame, frames)
+        return {
+            'frozen_rate': float(self.left_out.mean()),
+            'time_to_halt': float(halt_time.mean()),
+            'halted_rate': float(self.halted.mean()),
+        }
+
+
+def simulate(params=None, frames=3600, num_groups=4, group_size=3, seed=0, topic_vectors=None,
+             population=None):
+    """パラメータ1組についてシミュレーションを1回実行し、集計結果を返す"""
+    sim = HeadlessSimulation(params, num_groups=num_groups, group_size=group_size,
+                             topic_vectors=topic_vectors, seed=seed, population=population)
+    return sim.run(frames)
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    result = simulate(num_groups=50, group_size=10, frames=1800)
+    print(result)
+    print(f"elapsed: {time.perf_counter() - start:.2f} s")
@@ -1,48 +1,22 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def generate_profile_vector(dim=20):
-    """
-    指定された分布(主要:45-60%, 副次:15-27%, その他)を持つ正規化ベクトルを生成
-    """
-    vec = np.zeros(dim)
-    indices = np.random.permutation(dim)
-    
-    # 1. 主要興味の設定 (45% - 60%)
-    primary_val = np.random.uniform(0.45, 0.60)
-    vec[indices[0]] = primary_val
-    
-    # 2. 副次興味の設定 (15% - 27%)
-    secondary_val = np.random.uniform(0.15, 0.27)
-    vec[indices[1]] = secondary_val
-    
-# 残りの18次元に2-10%をランダムに割り当て
-    for i in range(2, dim):
-        vec[indices[i]] = np.random.uniform(0.02, 0.10)
-    
-    vec = vec / np.sum(vec)
-    vec = vec / np.linalg.norm(vec)
-    return vec
+from population import sample_profiles
 
 # シミュレーション設定
 n_simulations = 10000
-scores_diff = []
-user1_scores = []
-user2_scores = []
+rng = np.random.default_rng()
 
-for _ in range(n_simulations):
-    # ユーザー1, ユーザー2, および話題のベクトルを生成
-    u1 = generate_profile_vector()
-    u2 = generate_profile_vector()
-    topic = generate_profile_vector()
-    
-    # 興味スコア (内積) を計算
-    s1 = np.dot(u1, topic)
-    s2 = np.dot(u2, topic)
-    
-    user1_scores.append(s1)
-    user2_scores.append(s2)
-    scores_diff.append(abs(s1 - s2))
+# ユーザー1, ユーザー2, および話題のベクトルを一括生成
+# (主要:45-60%, 副次:15-27%, その他 の分布は population.py と共通)
+u1 = sample_profiles(rng, n_simulations, distribution='primary_secondary')
+u2 = sample_profiles(rng, n_simulations, distribution='primary_secondary')
+topic = sample_profiles(rng, n_simulations, distribution='primary_secondary')
+
+# 興味スコア (内積) を計算
+user1_scores = np.einsum('ij,ij->i', u1, topic)
+user2_scores = np.einsum('ij,ij->i', u2, topic)
+scores_diff = np.abs(user1_scores - user2_scores)
 
 # 統計分析
 diff_array = np.array(scores_diff)
@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import numpy as np
+
+# メンバーの状態（js/models/Member.js の Member.STATES に対応）
+STATE_ACTIVE = 0
+STATE_AT_RISK = 1
+STATE_LEFT_OUT = 2
+STATE_NAMES = {STATE_ACTIVE: 'active', STATE_AT_RISK: 'at_risk', STATE_LEFT_OUT: 'left_out'}
+
+
+class _GroupState:
+    """スケジューラ内部で保持する1グループ分の状態"""
+
+    def __init__(self, latent_interests):
+        self.latent = np.asarray(latent_interests, dtype=float)
+        n = len(self.latent)
+        self.topic_index = None
+        self.velocities = np.zeros(n)
+        self.order = np.arange(n)              # velocities の昇順インデックス
+        self.sorted_velocities = np.zeros(n)
+        self.left_out = np.zeros(n, dtype=bool)
+        self.states = np.full(n, STATE_ACTIVE, dtype=np.int8)
+        self.group_velocity = 0.0
+
+    def update_group_velocity(self):
+        """Group.getGroupVelocity と同じく離脱していないメンバーの平均速度"""
+        active = ~self.left_out
+        self.group_velocity = float(self.velocities[active].mean()) if active.any() else 0.0
+
+
+class MemberStateScheduler:
+    """
+    イベント駆動によるメンバー状態（離脱予兆・復帰）の判定。
+
+    Group.update は leftOutCheckFrequency フレームごとに全グループの全メンバーを判定するが、
+    相対速度 (vG - v_i) が変化するのは「話題への入室」と「グループ速度 vG の更新」のときだけである。
+    本クラスはそれらをイベントとしてキューに積み、発火時に影響を受けるメンバーのみを再判定する。
+    イベントのないグループは一切処理しない。
+    """
+
+    def __init__(self, latent_interests, topic_vectors, recovery_threshold=0.07,
+                 max_interest=10.0, max_velocity=10.0):
+        """
+        Args:
+            latent_interests: グループごとの潜在興味ベクトル (G, M, D) もしくは (M, D) のリスト
+            topic_vectors: 話題ベクトル (T, D)
+            recovery_threshold: PARAMS.recoveryThreshold (v0)
+        """
+        self.groups = [_GroupState(latent) for latent in latent_interests]
+        self.topic_vectors = np.asarray(topic_vectors, dtype=float)
+        self.recovery_threshold = float(recovery_threshold)
+        self.max_interest = max_interest
+        self.max_velocity = max_velocity
+
+        self.frame = 0
+        self.evaluations = 0    # 判定したメンバー数の累計（ポーリングとの比較用）
+        self._queue = []
+        self._counter = itertools.count()  # 同一フレーム内のイベント順序を保つ
+
+    # --- イベントの登録 ---
+    def _schedule(self, frame, kind, *payload):
+        heapq.heappush(self._queue, (frame, next(self._counter), kind, payload))
+
+    def enter_topic(self, group_id, topic_index, frame=None):
+        """グループが話題に入室した（Group._updateCurrentTopic に対応）"""
+        self._schedule(self.frame if frame is None else frame, 'topic', group_id, topic_index)
+
+    def set_left_out(self, group_id, member_id, left_out=True, frame=None):
+        """メンバーの離脱・復帰（グループ速度 vG が変化する）"""
+        self._schedule(self.frame if frame is None else frame, 'left_out', group_id, member_id, left_out)
+
+    def set_recovery_threshold(self, value, frame=None):
+        """PARAMS.recoveryThreshold の変更（UIスライダー等）"""
+        self._schedule(self.frame if frame is None else frame, 'threshold', value)
+
+    def next_event_frame(self):
+        """次にイベントが発火するフレーム（なければ None）"""
+        return self._queue[0][0] if self._queue else None
+
+    # --- イベントの処理 ---
+    def advance(self, frame):
+        """
+        指定フレームまでのイベントを順に処理する。
+
+        Returns:
+            list of (frame, group_id, member_id, old_state, new_state): 状態遷移の一覧
+        """
+        transitions = []
+        while self._queue and self._queue[0][0] <= frame:
+            event_frame, _, kind, payload = heapq.heappop(self._queue)
+            self.frame = event_frame
+            if kind == 'topic':
+                self._on_topic(event_frame, *payload, transitions)
+            elif kind == 'left_out':
+                self._on_left_out(event_frame, *payload, transitions)
+            elif kind == 'threshold':
+                self._on_threshold(event_frame, *payload, transitions)
+        self.frame = frame
+        return transitions
+
+    def _on_topic(self, frame, group_id, topic_index, transitions):
+        g = self.groups[group_id]
+        g.topic_index = topic_index
+
+        # 式3・式5: 興味度 = 内積 * maxInterest, 速度 = 興味度 * maxVelocity / maxInterest
+        interest = (g.latent @ self.topic_vectors[topic_index]) * self.max_interest
+        g.velocities = interest * self.max_velocity / self.max_interest
+        g.order = np.argsort(g.velocities, kind='stable')
+        g.sorted_velocities = g.velocities[g.order]
+        g.update_group_velocity()
+
+        # 全員の速度が変わるのでグループ全体を再判定
+        self._evaluate(frame, group_id, np.arange(len(g.velocities)), transitions)
+
+    def _on_left_out(self, frame, group_id, member_id, left_out, transitions):
+        g = self.groups[group_id]
+        if g.left_out[member_id] == left_out:
+            return
+        g.left_out[member_id] = left_out
+        old_state = int(g.states[member_id])
+        g.states[member_id] = STATE_LEFT_OUT if left_out else STATE_ACTIVE
+        if old_state != g.states[member_id]:
+            transitions.append((frame, group_id, member_id, old_state, int(g.states[member_id])))
+
+        old_boundary = g.group_velocity - self.recovery_threshold
+        g.update_group_velocity()
+        new_boundary = g.group_velocity - self.recovery_threshold
+        affected = self._crossing_members(g, old_boundary, new_boundary)
+        if not left_out:
+            affected = np.union1d(affected, [member_id])
+        self._evaluate(frame, group_id, affected, transitions)
+
+    def _on_threshold(self, frame, value, transitions):
+        old_threshold = self.recovery_threshold
+        self.recovery_threshold = float(value)
+        for group_id, g in enumerate(self.groups):
+            if g.topic_index is None:
+                continue
+            affected = self._crossing_members(
+                g, g.group_velocity - old_threshold, g.group_velocity - self.recovery_threshold
+            )
+            self._evaluate(frame, group_id, affected, transitions)
+
+    @staticmethod
+    def _crossing_members(g, old_boundary, new_boundary):
+        """
+        判定境界 (v_i < vG - v0 なら AT_RISK) が old から new に動いたとき、
+        状態が変わりうるメンバー（速度が両境界の間にある者）のみを返す
+        """
+        lo, hi = sorted((old_boundary, new_boundary))
+        start = np.searchsorted(g.sorted_velocities, lo, side='left')
+        end = np.searchsorted(g.sorted_velocities, hi, side='right')
+        return g.order[start:end]
+
+    def _evaluate(self, frame, group_id, members, transitions):
+        """Group._handleMemberStates の判定を指定メンバーのみに適用する"""
+        g = self.groups[group_id]
+        members = np.asarray(members, dtype=np.int64)
+        members = members[~g.left_out[members]]
+        self.evaluations += len(members)
+        if len(members) == 0:
+            return
+
+        relative = g.group_velocity - g.velocities[members]
+        new_states = np.where(relative > self.recovery_threshold, STATE_AT_RISK, STATE_ACTIVE)
+        changed = new_states != g.states[members]
+        for member_id, new_state in zip(members[changed], new_states[changed]):
+            transitions.append((frame, group_id, int(member_id), int(g.states[member_id]), int(new_state)))
+        g.states[members] = new_states
+
+    # --- 集計 ---
+    def get_states(self, group_id):
+        return self.groups[group_id].states.copy()
+
+    def get_at_risk_count(self, group_id):
+        return int(np.sum(self.groups[group_id].states == STATE_AT_RISK))
+
+
+if __name__ == "__main__":
+    import json
+
+    # topics.json と乱数の興味ベクトルで、ポーリング方式との判定回数を比較
+    with open('../data/topics/topics.json', 'r', encoding='utf-8') as f:
+        topics = json.load(f)
+    topic_vectors = np.array([t['vector'] for t in topics])
+
+    rng = np.random.default_rng(0)
+    num_groups, group_size, dim = 100, 50, topic_vectors.shape[1]
+    latent = rng.uniform(0.02, 0.10, size=(num_groups, group_size, dim))
+    latent /= np.linalg.norm(latent, axis=2, keepdims=True)
+
+    frames, check_frequency = 3600, 45
+    scheduler = MemberStateScheduler(latent, topic_vectors)
+    for group_id in range(num_groups):
+        # 各グループは数百フレームに1回程度話題を移る想定
+        for frame in np.sort(rng.integers(0, frames, size=rng.integers(0, 10))):
+            scheduler.enter_topic(group_id, int(rng.integers(len(topic_vectors))), frame=int(frame))
+
+    transitions = scheduler.advance(frames)
+    polling = (frames // check_frequency) * num_groups * group_size
+    print(f"transitions: {len(transitions)}")
+    print(f"event-driven evaluations: {scheduler.evaluations}")
+    print(f"polling evaluations:      {polling}")
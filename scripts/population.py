@@ -0,0 +1,177 @@
+import numpy as np
+from multiprocessing import Pool, shared_memory, util
+
+# 興味プロファイルの分布
+#   primary:           主要 0.50-0.70 / その他 0.02-0.10（js/models/Member.js と同じ）
+#   primary_secondary: 主要 0.45-0.60 / 副次 0.15-0.27 / その他 0.02-0.10（interest_statistics.py と同じ）
+DISTRIBUTIONS = ('primary', 'primary_secondary')
+
+# 派生メンバー
+#   max_of_others: グループ内の他メンバーの各次元の最大値（Member.js の ID 9 用）
+DERIVED = (None, 'max_of_others')
+
+
+def sample_profiles(rng, n, dim=20, distribution='primary'):
+    """
+    n 人分の潜在興味ベクトルを一括生成し、L2正規化して返す (n, dim)。
+
+    Args:
+        rng: np.random.Generator
+        distribution: DISTRIBUTIONS のいずれか
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+    vec = rng.uniform(0.02, 0.10, size=(n, dim))
+    rows = np.arange(n)
+
+    if distribution == 'primary':
+        primary = rng.integers(dim, size=n)
+        vec[rows, primary] = rng.uniform(0.50, 0.70, size=n)
+    else:
+        # 行ごとに異なる2次元を選ぶ（乱数キーの argsort で行ごとの順列を作る）
+        perm = np.argsort(rng.random((n, dim)), axis=1)
+        vec[rows, perm[:, 0]] = rng.uniform(0.45, 0.60, size=n)
+        vec[rows, perm[:, 1]] = rng.uniform(0.15, 0.27, size=n)
+        vec /= vec.sum(axis=1, keepdims=True)
+
+    vec /= np.linalg.norm(vec, axis=1, keepdims=True)
+    return vec
+
+
+def fill_groups(out, rng, distribution='primary', derived=None):
+    """
+    (グループ数, グループ人数, 次元) の配列 out をその場で埋める。
+    derived が指定された場合、各グループの最後のメンバーを派生メンバーに置き換える。
+    """
+    if derived not in DERIVED:
+        raise ValueError(f"Unknown derived member: {derived}")
+
+    num_groups, group_size, dim = out.shape
+    out[:] = sample_profiles(rng, num_groups * group_size, dim, distribution).reshape(out.shape)
+
+    if derived == 'max_of_others' and group_size > 1:
+        derived_vec = out[:, :-1, :].max(axis=1)
+        derived_vec /= np.linalg.norm(derived_vec, axis=1, keepdims=True)
+        out[:, -1, :] = derived_vec
+
+
+class SharedPopulation:
+    """
+    multiprocessing.shared_memory 上の float32 配列 (グループ数, グループ人数, 次元)。
+    ワーカーには spec() を渡し、attach() で同じメモリを参照させる（pickle によるコピーは発生しない）。
+    """
+
+    def __init__(self, shm, shape, owner):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=np.float32, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, num_groups, group_size, dim=20):
+        shape = (num_groups, group_size, dim)
+        nbytes = int(np.prod(shape)) * np.dtype(np.float32).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        return cls(shm, shape, owner=True)
+
+    @classmethod
+    def attach(cls, spec):
+        name, shape = spec
+        return cls(shared_memory.SharedMemory(name=name), shape, owner=False)
+
+    def spec(self):
+        """ワーカーへ渡すための (共有メモリ名, 形状)"""
+        return self.shm.name, self.shape
+
+    def close(self):
+        # ndarray がバッファを参照したままだと close できないため先に解放する
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- ワーカー側の処理 ---
+_worker_population = None
+
+
+def attach_worker(spec):
+    """
+    Pool の initializer から呼ぶ attach。ワーカー終了時に close されるよう登録する。
+    Pool のワーカーは atexit を実行しないため multiprocessing.util.Finalize を使う
+    （呼び出し側は terminate ではなく pool.close(); pool.join() で終了させること）。
+    """
+    population = SharedPopulation.attach(spec)
+    util.Finalize(population, population.close, exitpriority=10)
+    return population
+
+
+def _init_worker(spec):
+    global _worker_population
+    _worker_population = attach_worker(spec)
+
+
+def _fill_block(task):
+    start, stop, seed, distribution, derived = task
+    rng = np.random.default_rng(seed)
+    block = np.empty((stop - start,) + _worker_population.shape[1:], dtype=np.float64)
+    fill_groups(block, rng, distribution, derived)
+    _worker_population.array[start:stop] = block
+
+
+def generate_population(num_groups, group_size, dim=20, distribution='primary', derived=None,
+                        seed=0, block_groups=65536, workers=1):
+    """
+    シード付きのブロック単位でメンバー集団を生成し、共有メモリに格納して返す。
+
+    ブロックごとに SeedSequence.spawn で独立した乱数列を割り当てるため、
+    workers の数に関係なく同じ seed からは同じ集団が得られる。
+    呼び出し側は使用後に close() すること（with 文でも可）。
+    """
+    global _worker_population
+    population = SharedPopulation.create(num_groups, group_size, dim)
+
+    starts = list(range(0, num_groups, block_groups))
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [
+        (start, min(start + block_groups, num_groups), block_seed, distribution, derived)
+        for start, block_seed in zip(starts, seeds)
+    ]
+
+    try:
+        if workers <= 1:
+            _worker_population = population
+            for task in tasks:
+                _fill_block(task)
+            _worker_population = None
+        else:
+            with Pool(workers, initializer=_init_worker, initargs=(population.spec(),)) as pool:
+                pool.map(_fill_block, tasks)
+                pool.close()
+                pool.join()
+    except Exception:
+        population.close()
+        raise
+
+    return population
+
+
+if __name__ == "__main__":
+    import time
+
+    # 10人グループ × 20万グループ（200万人）を生成
+    start = time.perf_counter()
+    with generate_population(200_000, 10, derived='max_of_others', seed=42, workers=4) as population:
+        elapsed = time.perf_counter() - start
+        members = population.array.reshape(-1, population.shape[-1])
+        print(f"Generated {len(members)} members in {elapsed:.2f} s")
+        print(f"Shared memory: {population.spec()[0]} ({population.array.nbytes / 1e6:.1f} MB)")
+        print(f"Mean primary weight: {members.max(axis=1).mean():.4f}")
+        del members  # 共有メモリを close する前にビューを解放
@@ -0,0 +1,165 @@
+import numpy as np
+
+# セル座標をひとつの整数キーにまとめるための定数（負のセル座標にも対応）
+_KEY_OFFSET = 1 << 20
+_KEY_STRIDE = 1 << 21
+
+
+def flocking_radii(single_group_mode=False):
+    """Group.js の _getFlockingRadii と同じ探索半径を返す"""
+    if single_group_mode:
+        return {'cohesion': 80.0, 'alignment': 65.0, 'separation': 25.0}
+    return {'cohesion': 50.0, 'alignment': 40.0, 'separation': 15.0}
+
+
+class SpatialGrid:
+    """
+    一様グリッドによる空間ハッシュ（js/models/SpatialGrid.js のPython版）。
+    メンバーをセルキーでソートして保持し、周囲3x3セルの候補ペアをまとめて取り出す。
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.positions = np.zeros((0, 2))
+        self.cells = np.zeros((0, 2), dtype=np.int64)
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_keys = np.zeros(0, dtype=np.int64)
+
+    @staticmethod
+    def _keys(cols, rows):
+        return (cols + _KEY_OFFSET) * _KEY_STRIDE + (rows + _KEY_OFFSET)
+
+    def rebuild(self, positions):
+        """全メンバーをセルに振り分け直す（1フレームに1回呼ぶ）"""
+        self.positions = np.asarray(positions, dtype=float)
+        self.cells = np.floor(self.positions / self.cell_size).astype(np.int64)
+        keys = self._keys(self.cells[:, 0], self.cells[:, 1])
+        self.order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.order]
+
+    def candidate_pairs(self):
+        """
+        全メンバーについて、周囲3x3セルに含まれる相手との候補ペア (i, j) を返す。
+        自分自身とのペアは含まない。距離による絞り込みは呼び出し側で行う。
+        """
+        n = len(self.positions)
+        idx = np.arange(n)
+        pairs_i, pairs_j = [], []
+
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                keys = self._keys(self.cells[:, 0] + dx, self.cells[:, 1] + dy)
+                lo = np.searchsorted(self.sorted_keys, keys, side='left')
+                hi = np.searchsorted(self.sorted_keys, keys, side='right')
+                counts = hi - lo
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+
+                # 各メンバーのセル内オフセット (0..count-1) を展開してソート済み配列を引く
+                first = np.repeat(np.cumsum(counts) - counts, counts)
+                within = np.arange(total) - first
+                pairs_i.append(np.repeat(idx, counts))
+                pairs_j.append(self.order[np.repeat(lo, counts) + within])
+
+        if not pairs_i:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        i = np.concatenate(pairs_i)
+        j = np.concatenate(pairs_j)
+        mask = i != j
+        return i[mask], j[mask]
+
+    def query(self, point, radius):
+        """指定座標から radius 未満の距離にあるメンバーのインデックスを返す"""
+        col, row = np.floor(np.asarray(point, dtype=float) / self.cell_size).astype(np.int64)
+        found = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                key = self._keys(col + dx, row + dy)
+                lo = np.searchsorted(self.sorted_keys, key, side='left')
+                hi = np.searchsorted(self.sorted_keys, key, side='right')
+                found.append(self.order[lo:hi])
+        candidates = np.concatenate(found)
+        dist = np.linalg.norm(self.positions[candidates] - point, axis=1)
+        return candidates[dist < radius]
+
+
+def _set_mag(vectors, mag):
+    """p5.Vector.setMag 相当（ゼロベクトルはそのまま）"""
+    norm = np.linalg.norm(vectors, axis=1, keepdims=True)
+    safe = np.where(norm > 0, norm, 1.0)
+    return np.where(norm > 0, vectors / safe * mag, 0.0)
+
+
+def _limit(vectors, max_mag):
+    """p5.Vector.limit 相当"""
+    norm = np.linalg.norm(vectors, axis=1, keepdims=True)
+    scale = np.where(norm > max_mag, max_mag / np.where(norm > 0, norm, 1.0), 1.0)
+    return vectors * scale
+
+
+def flocking_forces(grid, vel, left_out, max_speed, max_force, radii):
+    """
+    Group.js の _flockingForces をグループ全員分まとめて計算する。
+    grid は現在の位置で rebuild 済みであること。
+
+    Returns:
+        (coh, ali, sep): それぞれ (M, 2) の力ベクトル
+    """
+    pos = grid.positions
+    vel = np.asarray(vel, dtype=float)
+    left_out = np.asarray(left_out, dtype=bool)
+    n = len(pos)
+
+    i, j = grid.candidate_pairs()
+    diff = pos[i] - pos[j]
+    d = np.linalg.norm(diff, axis=1)
+
+    # 結合・整列は離脱していない相手のみ、分離は全員が対象
+    coh_mask = ~left_out[j] & (d < radii['cohesion'])
+    ali_mask = ~left_out[j] & (d < radii['alignment'])
+    sep_mask = (d < radii['separation']) & (d > 0)
+
+    coh_count = np.bincount(i[coh_mask], minlength=n)
+    ali_count = np.bincount(i[ali_mask], minlength=n)
+
+    coh_sum = np.zeros((n, 2))
+    ali_sum = np.zeros((n, 2))
+    sep = np.zeros((n, 2))
+    np.add.at(coh_sum, i[coh_mask], pos[j[coh_mask]])
+    np.add.at(ali_sum, i[ali_mask], vel[j[ali_mask]])
+    np.add.at(sep, i[sep_mask], diff[sep_mask] / d[sep_mask, None])
+
+    has_coh = (coh_count > 0)[:, None]
+    coh_center = coh_sum / np.maximum(coh_count, 1)[:, None]
+    coh = _limit(_set_mag(coh_center - pos, max_speed) - vel, max_force)
+    coh = np.where(has_coh, coh, 0.0)
+
+    has_ali = (ali_count > 0)[:, None]
+    ali_mean = ali_sum / np.maximum(ali_count, 1)[:, None]
+    ali = _limit(_set_mag(ali_mean, max_speed) - vel, max_force)
+    ali = np.where(has_ali, ali, 0.0)
+
+    return coh, ali, _limit(sep, max_force)
+
+
+if __name__ == "__main__":
+    import time
+
+    # 大人数グループでの1フレームあたりのコストを確認
+    rng = np.random.default_rng(0)
+    radii = flocking_radii()
+    for m in (100, 1000, 10000):
+        size = np.sqrt(m) * 20
+        pos = rng.uniform(0, size, size=(m, 2))
+        vel = rng.normal(0, 0.2, size=(m, 2))
+        left_out = np.zeros(m, dtype=bool)
+
+        start = time.perf_counter()
+        grid = SpatialGrid(max(radii.values()))
+        grid.rebuild(pos)
+        coh, ali, sep = flocking_forces(grid, vel, left_out, 0.9, 0.05, radii)
+        elapsed = time.perf_counter() - start
+        print(f"M={m:6d}: {elapsed * 1000:.2f} ms / frame")
@@ -0,0 +1,258 @@
+import numpy as np
+from multiprocessing import Pool
+from scipy.stats import qmc
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+
+from headless_sim import load_topic_vectors, simulate
+from population import attach_worker, generate_population
+
+# 探索するパラメータ空間（js/config.js の PARAMS のキー: (下限, 上限)）
+PARAM_SPACE = {
+    'leftOutThreshold': (0.02, 0.5),
+    'recoveryThreshold': (0.01, 0.3),
+    'cohesionWeight': (0.0, 5.0),
+}
+
+# 予測する指標（headless_sim.HeadlessSimulation.summary のキー）
+OUTCOMES = ('frozen_rate', 'time_to_halt')
+
+
+# --- ワーカー側の処理 ---
+_population = None
+
+
+def _init_worker(spec):
+    global _population
+    _population = attach_worker(spec)
+
+
+def _run_one(task):
+    params, sim_kwargs, start, stop = task
+    return simulate(params, population=_population.array[start:stop], **sim_kwargs)
+
+
+class FrozenRateSurrogate:
+    """
+    離脱率・停止までの時間をパラメータから予測する代理モデル（ガウス過程回帰）。
+
+    初期計画（ラテン超方格）でシミュレーションを実行してモデルを当てはめた後、
+    予測の不確かさが最も大きいパラメータを選んで追加実行する（能動学習）。
+    学習後は predict() でパラメータ空間上の任意の点を即座に問い合わせられる。
+
+    メンバー集団は population.generate_population で共有メモリ上に一度だけ生成し、
+    各実行はシードに応じた num_groups グループ分の範囲を使う（ワーカーへはコピーせず共有する）。
+    使用後は close() すること（with 文でも可）。
+    """
+
+    def __init__(self, param_space=None, outcomes=OUTCOMES, sim_kwargs=None, seed=0, workers=1,
+                 population_blocks=16):
+        """
+        Args:
+            param_space: {パラメータ名: (下限, 上限)}。省略時は PARAM_SPACE
+            sim_kwargs: headless_sim.simulate に渡す追加引数（frames, num_groups など）
+            workers: シミュレーションを並列実行するプロセス数
+            population_blocks: 共有するメンバー集団の組数（1組 = 1回の実行分のグループ）
+        """
+        self.param_space = dict(PARAM_SPACE if param_space is None else param_space)
+        self.names = list(self.param_space)
+        self.lower = np.array([self.param_space[k][0] for k in self.names], dtype=float)
+        self.upper = np.array([self.param_space[k][1] for k in self.names], dtype=float)
+        self.outcomes = tuple(outcomes)
+        self.sim_kwargs = dict(sim_kwargs or {})
+        self.workers = workers
+
+        self.rng = np.random.default_rng(seed)
+        self.sampler = qmc.LatinHypercube(d=len(self.names), rng=self.rng)
+        self.X = np.zeros((0, len(self.names)))     # 単位超立方体 [0, 1]^d 上の実行点
+        self.Y = np.zeros((0, len(self.outcomes)))
+        self.models = {}
+
+        # 全実行で共有するメンバー集団
+        self.num_groups = self.sim_kwargs.get('num_groups', 4)
+        group_size = self.sim_kwargs.get('group_size', 3)
+        topic_vectors = self.sim_kwargs.get('topic_vectors')
+        dim = (load_topic_vectors() if topic_vectors is None else np.asarray(topic_vectors)).shape[1]
+        self.population_blocks = population_blocks
+        self.population = generate_population(population_blocks * self.num_groups, group_size, dim,
+                                              seed=seed, workers=workers)
+
+    def close(self):
+        self.population.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 座標変換 ---
+    def _to_params(self, u):
+        values = self.lower + np.asarray(u) * (self.upper - self.lower)
+        return {k: float(v) for k, v in zip(self.names, values)}
+
+    def _to_unit(self, params):
+        values = np.array([params[k] for k in self.names], dtype=float)
+        return (values - self.lower) / (self.upper - self.lower)
+
+    # --- シミュレーションの実行 ---
+    def _task(self, params, seed):
+        """シードに応じて共有メンバー集団のどの組を使うかを決める"""
+        start = (seed % self.population_blocks) * self.num_groups
+        return params, dict(self.sim_kwargs, seed=seed), start, start + self.num_groups
+
+    def _run_tasks(self, tasks):
+        """_task のリストを（workers > 1 なら並列で）実行し、指標を (n, 指標数) で返す"""
+        global _population
+        if self.workers > 1:
+            with Pool(self.workers, initializer=_init_worker, initargs=(self.population.spec(),)) as pool:
+                results = pool.map(_run_one, tasks)
+                pool.close()
+                pool.join()
+        else:
+            _population = self.population
+            results = [_run_one(task) for task in tasks]
+            _population = None
+        return np.array([[r[k] for k in self.outcomes] for r in results], dtype=float)
+
+    def _evaluate(self, U):
+        """単位超立方体上の点 U (n, d) でシミュレーションを実行し、結果を蓄積する"""
+        seeds = self.rng.integers(2**31, size=len(U))
+        Y = self._run_tasks([self._task(self._to_params(u), int(s)) for u, s in zip(U, seeds)])
+        self.X = np.vstack([self.X, U])
+        self.Y = np.vstack([self.Y, Y])
+        return Y
+
+    def check_sensitivity(self, num_seeds=3):
+        """
+        診断用: 各パラメータを探索範囲の下限・上限に振り（他は中央）、指標の変化を調べる。
+        結果はモデルの学習には使わない。
+
+        Returns:
+            {パラメータ名: {指標: (上限での平均 - 下限での平均, シード間の標準誤差)}}
+        """
+        center = (self.lower + self.upper) / 2
+        effects = {}
+        for j, name in enumerate(self.names):
+            samples = []
+            for bound in (self.lower[j], self.upper[j]):
+                values = center.copy()
+                values[j] = bound
+                params = dict(zip(self.names, values.tolist()))
+                samples.append(self._run_tasks([self._task(params, seed) for seed in range(num_seeds)]))
+
+            low, high = samples
+            diff = high.mean(axis=0) - low.mean(axis=0)
+            stderr = np.sqrt(low.var(axis=0, ddof=1) / num_seeds + high.var(axis=0, ddof=1) / num_seeds)
+            effects[name] = {k: (float(d), float(e)) for k, d, e in zip(self.outcomes, diff, stderr)}
+        return effects
+
+    def run_initial_design(self, n=20):
+        """ラテン超方格による初期計画を実行してモデルを当てはめる"""
+        self._evaluate(self.sampler.random(n))
+        self.fit()
+
+    # --- モデル ---
+    def fit(self):
+        d = len(self.names)
+        for j, outcome in enumerate(self.outcomes):
+            kernel = (ConstantKernel(1.0) * Matern(length_scale=np.full(d, 0.3), nu=2.5)
+                      + WhiteKernel(noise_level=1e-2))
+            model = GaussianProcessRegressor(kernel=kernel, normalize_y=True, n_restarts_optimizer=2,
+                                             random_state=int(self.rng.integers(2**31)))
+            model.fit(self.X, self.Y[:, j])
+            self.models[outcome] = model
+
+    def _uncertainty(self, U):
+        """各指標の予測標準偏差を、観測値のばらつきで正規化して合計したもの"""
+        total = np.zeros(len(U))
+        for j, outcome in enumerate(self.outcomes):
+            _, std = self.models[outcome].predict(U, return_std=True)
+            scale = self.Y[:, j].std()
+            total += std / (scale if scale > 0 else 1.0)
+        return total
+
+    def suggest(self, n=1, num_candidates=2000, min_distance=0.1):
+        """
+        不確かさが最大となる点を n 個選ぶ。
+        同じ付近ばかり選ばないよう、選んだ点から min_distance 以内の候補は除外する。
+        """
+        candidates = self.sampler.random(num_candidates)
+        score = self._uncertainty(candidates)
+        chosen = []
+        for _ in range(n):
+            best = int(np.argmax(score))
+            if not np.isfinite(score[best]):
+                break
+            chosen.append(candidates[best])
+            near = np.linalg.norm(candidates - candidates[best], axis=1) < min_distance
+            score[near] = -np.inf
+        return np.array(chosen)
+
+    def run_active_learning(self, iterations=20, batch_size=4, verbose=True):
+        """不確かさの大きい点でのシミュレーション実行とモデルの再学習を繰り返す"""
+        if not self.models:
+            self.run_initial_design()
+        for it in range(iterations):
+            self._evaluate(self.suggest(batch_size))
+            self.fit()
+            if verbose:
+                mean_unc = self._uncertainty(self.sampler.random(500)).mean()
+                print(f"iter {it + 1}/{iterations}: {len(self.X)} runs, mean uncertainty {mean_unc:.4f}")
+
+    # --- 問い合わせ ---
+    def predict(self, params):
+        """
+        パラメータ（dict もしくは dict のリスト）に対する予測値を返す。
+        指定しなかったパラメータは探索範囲の中央とする。
+
+        Returns:
+            {指標: (平均, 標準偏差)}。入力がリストの場合は各値が配列になる
+        """
+        single = isinstance(params, dict)
+        rows = [params] if single else list(params)
+        center = (self.lower + self.upper) / 2
+        U = np.array([
+            self._to_unit({**dict(zip(self.names, center)), **p}) for p in rows
+        ])
+
+        result = {}
+        for outcome in self.outcomes:
+            mean, std = self.models[outcome].predict(U, return_std=True)
+            if outcome.endswith('_rate'):
+                mean = np.clip(mean, 0.0, 1.0)
+            result[outcome] = (float(mean[0]), float(std[0])) if single else (mean, std)
+        return result
+
+    def predict_grid(self, x_name, y_name, resolution=50, fixed=None):
+        """2つのパラメータについて格子上の予測値を返す（地形図の描画用）"""
+        xs = np.linspace(*self.param_space[x_name], resolution)
+        ys = np.linspace(*self.param_space[y_name], resolution)
+        grid = [dict(fixed or {}, **{x_name: x, y_name: y}) for y in ys for x in xs]
+        pred = self.predict(grid)
+        return xs, ys, {k: (m.reshape(resolution, resolution), s.reshape(resolution, resolution))
+                        for k, (m, s) in pred.items()}
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    with FrozenRateSurrogate(sim_kwargs={'frames': 1800, 'num_groups': 20}, workers=4) as surrogate:
+        surrogate.run_initial_design(n=24)
+        surrogate.run_active_learning(iterations=15, batch_size=4)
+    print(f"Total simulation runs: {len(surrogate.X)}")
+
+    # 既定パラメータでの予測
+    print(surrogate.predict({'leftOutThreshold': 0.12, 'recoveryThreshold': 0.07, 'cohesionWeight': 2.0}))
+
+    # 離脱率の地形図
+    xs, ys, pred = surrogate.predict_grid('leftOutThreshold', 'cohesionWeight',
+                                          fixed={'recoveryThreshold': 0.07})
+    mean, _ = pred['frozen_rate']
+    plt.figure(figsize=(8, 6))
+    plt.contourf(xs, ys, mean, levels=20, cmap='viridis')
+    plt.colorbar(label='Frozen member rate')
+    plt.xlabel('leftOutThreshold')
+    plt.ylabel('cohesionWeight')
+    plt.title('Surrogate: Frozen Member Rate')
+    plt.show()